@@ -0,0 +1 @@
+"""Custom Mem0 MCP server."""
@@ -0,0 +1,31 @@
+"""Entry point: ``python -m src.app``.
+
+Only the in-process branch imports src.app.main. The reloader and the worker
+supervisor pass an import string instead, so they never build a memory service
+of their own; each served process builds its own when it imports the app.
+"""
+
+import asyncio
+
+import uvicorn
+
+from src.app.server import server_options, uvloop
+from src.config.config import get_config
+
+APP = "src.app.main:app"
+
+if __name__ == "__main__":
+    cfg = get_config()
+    if cfg.dev_mode:
+        # The reloader needs an import string and runs its own event loop
+        uvicorn.run(APP, reload=True, reload_dirs=["src/"], **server_options())
+    elif cfg.workers > 1:
+        # Multi-process serving always uses uvicorn. Workers are spawned processes,
+        # each importing the app and building its own memory service; the supervisor
+        # handles signals and restarts
+        uvicorn.run(APP, workers=cfg.workers, **server_options())
+    else:
+        from src.app.main import main
+
+        # Run the outer loop on uvloop as well, since server.serve() reuses it
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
@@ -1,41 +1,44 @@
 import asyncio
 import logging
 import signal
-import sys
-from contextlib import AsyncExitStack, asynccontextmanager
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 
+import anyio.to_thread
 import uvicorn
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from uvicorn.server import HANDLED_SIGNALS as UVICORN_HANDLED_SIGNALS
 
 from src.app.memory.memory import get_memory_service
+from src.app.memory.warmup import run_warmup
+from src.app.server import server_options
 from src.config.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Resolve the memory service once per process
+_memory_service = get_memory_service()
+
 
 @asynccontextmanager
 async def app_lifespan(app: FastAPI):
     """Manage application lifecycle with type-safe context"""
     # Initialize on startup
-    try:
-        async with AsyncExitStack() as stack:
-            # Add more context managers as needed
-            await stack.enter_async_context(
-                get_memory_service().mcp.session_manager.run()
-            )
-            yield
-    finally:
-        # Cleanup on shutdown
-        pass
-
-
-def handle_shutdown_signal(signum, frame):
-    """Handle shutdown signals"""
-    logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-
-    # Exit gracefully
-    sys.exit(0)
+    cfg = get_config()
+    thread_tokens = cfg.anyio_thread_tokens
+    # Raise the default 40-thread limit so blocking mem0 calls can run in parallel
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = thread_tokens
+    # AsyncMemory offloads through asyncio.to_thread, which uses the loop's executor
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=thread_tokens)
+    )
+    async with _memory_service.mcp.session_manager.run():
+        # Pre-warm connections so the first request doesn't pay for them
+        await run_warmup(_memory_service.warmup, cfg.warmup_timeout)
+        yield
 
 
 # Initialize FastAPI app
@@ -43,19 +46,20 @@ app = FastAPI(
     title="Custom Mem0 MCP Server",
     description="A custom Mem0 implementation with MCP (Model Context Protocol) support",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=app_lifespan,
 )
 
 
 # Health check endpoint
-@app.get("/health", response_class=JSONResponse)
+@app.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Health check endpoint for container orchestration"""
     return {"status": "healthy", "service": "custom-mem0-mcp"}
 
 
 # Root endpoint
-@app.get("/", response_class=JSONResponse)
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     """Root endpoint with service information"""
     return {
@@ -66,38 +70,79 @@ async def root():
     }
 
 
-app.mount("/memory", get_memory_service().mcp.streamable_http_app())
+app.mount("/memory", _memory_service.http_app)
 
 
-async def main():
-    # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, handle_shutdown_signal)
-    signal.signal(signal.SIGTERM, handle_shutdown_signal)
-
-    # Add additional signal handling for development reloads
-    if hasattr(signal, "SIGHUP"):
-        signal.signal(signal.SIGHUP, handle_shutdown_signal)
-
-    config = uvicorn.Config(
-        app,
-        host=get_config().fastapi_host,
-        port=get_config().fastapi_port,
-        ws_ping_interval=10,
-        ws_ping_timeout=20,
-        log_level=get_config().memory_log_level,
-        use_colors=True,
-        access_log=True,
+SHUTDOWN_SIGNALS = tuple(
+    sig
+    for sig in (signal.SIGINT, signal.SIGTERM, getattr(signal, "SIGHUP", None))
+    if sig
+)
+
+
+def install_shutdown_handlers(
+    on_shutdown: Callable[[], None],
+    signals: Iterable[signal.Signals] = SHUTDOWN_SIGNALS,
+) -> None:
+    """Call on_shutdown for termination signals instead of exiting immediately"""
+
+    def handle_shutdown_signal(signum: signal.Signals) -> None:
+        """Ask the server to stop accepting connections and drain in-flight requests"""
+        logger.info(f"Received signal {signum.name}, initiating graceful shutdown...")
+        on_shutdown()
+
+    loop = asyncio.get_running_loop()
+    for sig in signals:
+        # add_signal_handler is not implemented on Windows event loops
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, handle_shutdown_signal, sig)
+
+
+async def serve_uvicorn():
+    server = uvicorn.Server(uvicorn.Config(app, **server_options()))
+    # uvicorn drains on the signals it captures itself and re-raises them on exit,
+    # so only cover the ones it leaves alone
+    install_shutdown_handlers(
+        lambda: setattr(server, "should_exit", True),
+        [sig for sig in SHUTDOWN_SIGNALS if sig not in UVICORN_HANDLED_SIGNALS],
+    )
+    await server.serve()
+
+
+async def serve_hypercorn():
+    """Serve with Hypercorn, which negotiates HTTP/2 via ALPN when TLS is configured"""
+    # Imported here so the default uvicorn path never loads hypercorn
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config as HypercornConfig
+
+    cfg = get_config()
+    config = HypercornConfig()
+    config.bind = [f"{cfg.fastapi_host}:{cfg.fastapi_port}"]
+    config.alpn_protocols = ["h2", "http/1.1"]
+    # Browsers only speak HTTP/2 over TLS; without certificates clients need h2c
+    config.certfile = cfg.tls_certfile
+    config.keyfile = cfg.tls_keyfile
+    # Hypercorn uses stdlib logging levels, which have no TRACE
+    config.loglevel = (
+        "debug" if cfg.memory_log_level == "trace" else cfg.memory_log_level
     )
-    server = uvicorn.Server(config)
+    config.accesslog = "-"
+    config.graceful_timeout = 30
 
+    shutdown_event = asyncio.Event()
+    install_shutdown_handlers(shutdown_event.set)
+    await hypercorn_serve(app, config, shutdown_trigger=shutdown_event.wait)
+
+
+async def main():
     try:
-        await server.serve()
+        match get_config().server_impl:
+            case "hypercorn":
+                await serve_hypercorn()
+            case _:
+                await serve_uvicorn()
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
     except Exception as e:
         logger.error(f"Server error: {str(e)}")
         raise
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
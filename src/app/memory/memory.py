@@ -1,10 +1,11 @@
+import asyncio
 import functools
+import logging
 from typing import Annotated
 
 from mcp.server.fastmcp import Context, FastMCP
 from mem0 import AsyncMemory
 from mem0.configs.base import GraphStoreConfig, MemoryConfig
-from mem0.configs.vector_stores.pgvector import PGVectorConfig
 from mem0.embeddings.configs import EmbedderConfig
 from mem0.graphs.configs import LlmConfig, Neo4jConfig
 from mem0.vector_stores.configs import VectorStoreConfig
@@ -12,28 +13,68 @@ from pydantic import Field
 
 from src.config.config import get_config
 
+logger = logging.getLogger(__name__)
+
+
+async def _add_memory_impl(
+    memory: AsyncMemory, data: str, user_id: str, agent_id: str | None = None
+):
+    """Add a memory for a user, optionally scoped to an agent."""
+    await memory.add(data, user_id=user_id, agent_id=agent_id)
+
+
+async def _get_all_memories_impl(
+    memory: AsyncMemory, user_id: str, agent_id: str | None = None, limit: int = 100
+) -> dict:
+    """Retrieve up to ``limit`` memories for a user, optionally scoped to an agent."""
+    return await memory.get_all(user_id=user_id, agent_id=agent_id, limit=limit)
+
+
+async def _delete_all_memories_impl(
+    memory: AsyncMemory, user_id: str, agent_id: str | None = None
+):
+    """Delete all memories for a user, optionally scoped to an agent."""
+    await memory.delete_all(user_id=user_id, agent_id=agent_id)
+
+
+async def _search_memories_impl(
+    memory: AsyncMemory, query: str, user_id: str, agent_id: str | None = None
+) -> dict:
+    """Search a user's memories, optionally scoped to an agent."""
+    return await memory.search(query, user_id=user_id, agent_id=agent_id)
 
-class MemoryMCP:
-    _mcp = FastMCP("Memory", "Memory service for managing user and agent memories.")
 
+async def _update_memory_impl(memory: AsyncMemory, memory_id: str, data: str) -> dict:
+    """Replace the content of a memory."""
+    return await memory.update(memory_id, data)
+
+
+async def _delete_memory_impl(memory: AsyncMemory, memory_id: str):
+    """Delete a memory by its ID."""
+    await memory.delete(memory_id)
+
+
+class MemoryMCP:
     def __init__(self):
         """Initialize the Memory service with the appropriate configuration based on the backend specified in the config."""
-        match get_config().backend:
+        cfg = get_config()
+        match cfg.backend:
             case "pgvector":
                 self._config = MemoryConfig(
                     vector_store=VectorStoreConfig(
                         provider="pgvector",  # Use pgvector for Neo4j
-                        config=PGVectorConfig(
-                            host=get_config().postgres_host,
-                            port=get_config().postgres_port,
-                            dbname=get_config().postgres_database,
-                            user=get_config().postgres_user,
-                            password=get_config().postgres_password,
-                            collection_name=get_config().postgres_collection_name,
-                            diskann=True,  # Use DiskANN for efficient vector search
-                            hnsw=False,  # Disable HNSW for Neo4j
-                            embedding_model_dims=1536,  # Default dimensions for OpenAI embeddings
-                        ).model_dump(),
+                        # Plain dict: VectorStoreConfig builds and validates PGVectorConfig from it
+                        config={
+                            "host": cfg.postgres_host,
+                            "port": cfg.postgres_port,
+                            "dbname": cfg.postgres_database,
+                            "user": cfg.postgres_user,
+                            "password": cfg.postgres_password,
+                            "collection_name": cfg.postgres_collection_name,
+                            "diskann": True,  # Use DiskANN for efficient vector search
+                            "hnsw": False,  # Disable HNSW for Neo4j
+                            "embedding_model_dims": 1536,  # Default dimensions for OpenAI embeddings
+                        },
                     )
                 )
             case "qdrant":
@@ -41,20 +82,20 @@ class MemoryMCP:
                     vector_store=VectorStoreConfig(
                         provider="qdrant",
                         config={
-                            "host": get_config().qdrant_host,
-                            "port": get_config().qdrant_port
+                            "host": cfg.qdrant_host,
+                            "port": cfg.qdrant_port
                         },
                     )
                 )
             case _:
-                raise ValueError(f"Unsupported backend: {get_config().backend}")
+                raise ValueError(f"Unsupported backend: {cfg.backend}")
         # Initialize the graph store configuration
         self._config.graph_store = GraphStoreConfig(
             provider="neo4j",
             config=Neo4jConfig(
-                url=f"bolt://{get_config().neo4j_ip}",  # URI format for Neo4j, when SSL/TLS is not used else it should be "neo4j+s://"
-                username=get_config().neo4j_username,
-                password=get_config().neo4j_password,
+                url=f"bolt://{cfg.neo4j_ip}",  # URI format for Neo4j, when SSL/TLS is not used else it should be "neo4j+s://"
+                username=cfg.neo4j_username,
+                password=cfg.neo4j_password,
                 database=None,
                 base_label=None,
             ),
@@ -62,20 +103,23 @@ class MemoryMCP:
         self._config.llm = LlmConfig(
             provider="openai",
             config={
-                "api_key": get_config().openai_api_key,
-                "model": get_config().openai_model,
+                "api_key": cfg.openai_api_key,
+                "model": cfg.openai_model,
             },
         )
         self._config.embedder = EmbedderConfig(
             provider="openai",
             config={
-                "api_key": get_config().openai_api_key,
-                "model": get_config().openai_embedding_model,
+                "api_key": cfg.openai_api_key,
+                "model": cfg.openai_embedding_model,
             },
         )
-        self._config.history_db_path = get_config().history_db_path
+        self._config.history_db_path = cfg.history_db_path
 
         self._memory = AsyncMemory(config=self._config)
+        self._mcp = FastMCP(
+            "Memory", "Memory service for managing user and agent memories."
+        )
 
         # Register MCP tools and resources after initialization
         self._register_mcp_handlers()
@@ -83,7 +127,7 @@ class MemoryMCP:
     def _register_mcp_handlers(self):
         """Register MCP tools and resources after initialization."""
 
-        # Create closure functions that have access to self._memory
+        # Thin wrappers carry the MCP schema and bind self._memory to the impls
         @self._mcp.tool(
             name="add_memory",
             title="Add Memory",
@@ -108,7 +152,7 @@ class MemoryMCP:
             :param user_id: The ID of the user adding the memory.
             :param agent_id: Optional ID of the agent associated with the memory.
             """
-            await self._memory.add(data, user_id=user_id, agent_id=agent_id)
+            await _add_memory_impl(self._memory, data, user_id, agent_id)
 
         @self._mcp.resource(
             "memories://{user_id}/{agent_id}/{limit}",
@@ -140,9 +184,7 @@ class MemoryMCP:
             :param agent_id: Optional ID of the agent associated with the memories.
             :return: List of memories.
             """
-            return await self._memory.get_all(
-                user_id=user_id, agent_id=agent_id, limit=limit
-            )
+            return await _get_all_memories_impl(self._memory, user_id, agent_id, limit)
 
         @self._mcp.tool(
             name="delete_all_memories",
@@ -169,7 +211,7 @@ class MemoryMCP:
             :param user_id: The ID of the user whose memories are to be deleted.
             :param agent_id: Optional ID of the agent associated with the memories.
             """
-            await self._memory.delete_all(user_id=user_id, agent_id=agent_id)
+            await _delete_all_memories_impl(self._memory, user_id, agent_id)
 
         @self._mcp.tool(
             name="search_memories",
@@ -200,7 +242,7 @@ class MemoryMCP:
             await ctx.info(
                 f"Searching memories for user {user_id} with agent {agent_id}"
             )
-            return await self._memory.search(query, user_id=user_id, agent_id=agent_id)
+            return await _search_memories_impl(self._memory, query, user_id, agent_id)
 
         @self._mcp.tool(
             name="update_memory",
@@ -221,7 +263,7 @@ class MemoryMCP:
             :param data: The new content for the memory.
             """
             await ctx.info(f"Updating memory with ID {memory_id}")
-            return await self._memory.update(memory_id, data)
+            return await _update_memory_impl(self._memory, memory_id, data)
 
         @self._mcp.tool(
             name="delete_memory",
@@ -238,7 +280,48 @@ class MemoryMCP:
 
             :param memory_id: The ID of the memory to delete.
             """
-            await self._memory.delete(memory_id)
+            await _delete_memory_impl(self._memory, memory_id)
+
+    async def warmup(self):
+        """
+        Exercise the embedder, vector store and graph store ahead of the first request.
+
+        The stores are queried directly with a one-row lookup for a placeholder user;
+        AsyncMemory.get_all is avoided as it blocks the loop and emits telemetry.
+        Each failure is logged per backend. Callers bound this with a timeout; when it
+        is cancelled, the unfinished backends are logged and their threads keep running.
+        """
+        filters = {"user_id": "__warmup__"}
+        warmups = {
+            "embedder": asyncio.to_thread(
+                self._memory.embedding_model.embed, "warmup", "search"
+            ),
+            "vector store": asyncio.to_thread(
+                self._memory.vector_store.list, filters=filters, limit=1
+            ),
+        }
+        if self._memory.enable_graph:
+            warmups["graph store"] = asyncio.to_thread(
+                self._memory.graph.get_all, filters, 1
+            )
+        tasks = {
+            name: asyncio.ensure_future(warmup) for name, warmup in warmups.items()
+        }
+        try:
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        except asyncio.CancelledError:
+            pending = [name for name, task in tasks.items() if task.cancelled()]
+            logger.warning(
+                f"Warmup stopped before {', '.join(pending)} finished; "
+                "their calls keep running in the background"
+            )
+            raise
+        finally:
+            for name, task in tasks.items():
+                if task.done() and not task.cancelled() and task.exception():
+                    logger.warning(
+                        f"{name.capitalize()} warmup failed: {str(task.exception())}"
+                    )
 
     @property
     def mcp(self):
@@ -249,12 +332,28 @@ class MemoryMCP:
         """
         return self._mcp
 
+    @functools.cached_property
+    def http_app(self):
+        """
+        Get the streamable HTTP ASGI app for the MCP server, built once per instance.
+
+        FastMCP creates a new Starlette app on every streamable_http_app() call.
+
+        :return: Starlette application.
+        """
+        return self._mcp.streamable_http_app()
+
+
+_memory_service: MemoryMCP | None = None
+
 
-@functools.lru_cache(maxsize=1)
 def get_memory_service() -> MemoryMCP:
     """
     Get a singleton instance of the Memory service.
 
     :return: Memory service instance.
     """
-    return MemoryMCP()
+    global _memory_service
+    if _memory_service is None:
+        _memory_service = MemoryMCP()
+    return _memory_service
@@ -0,0 +1,29 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+async def run_warmup(warmup: Callable[[], Awaitable[None]], timeout: float) -> bool:
+    """
+    Run a warmup without letting a slow or failing backend hold up startup.
+
+    Threads started by the warmup are not interrupted by the timeout; they keep
+    running in the background until their calls return.
+
+    :param warmup: Coroutine function performing the warmup.
+    :param timeout: Seconds to wait before giving up on the warmup.
+    :return: True when the warmup completed.
+    """
+    try:
+        await asyncio.wait_for(warmup(), timeout=timeout)
+    except TimeoutError:
+        logger.warning(
+            f"Memory service warmup timed out after {timeout}s, continuing startup"
+        )
+        return False
+    except Exception as e:
+        logger.warning(f"Memory service warmup failed: {str(e)}")
+        return False
+    return True
@@ -0,0 +1,26 @@
+"""Server options shared by the launcher and the app, without importing the app."""
+
+from src.config.config import get_config
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+def server_options() -> dict:
+    """Build the uvicorn options shared by the in-process, reloading and worker servers"""
+    cfg = get_config()
+    return {
+        "host": cfg.fastapi_host,
+        "port": cfg.fastapi_port,
+        "loop": "uvloop" if uvloop else "asyncio",
+        "http": "httptools",
+        "interface": "asgi3",
+        "ws_ping_interval": 10,
+        "ws_ping_timeout": 20,
+        "log_level": cfg.memory_log_level,
+        "use_colors": True,
+        "access_log": True,
+        "timeout_graceful_shutdown": 30,
+    }
@@ -1,7 +1,10 @@
 """Configuration management for mem0."""
 
-from .config import Config, get_config
+from .config import Config, ConfigSnapshot, get_config
+
+# Guard against a stale, field-less settings class shadowing the real Config
+assert "postgres_host" in Config.model_fields, "wrong Config loaded"
 
 # Use get_config() function when you need the config instance
 
-__all__ = ["Config", "get_config"]
+__all__ = ["Config", "ConfigSnapshot", "get_config"]
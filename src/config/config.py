@@ -1,15 +1,27 @@
-import functools
+import logging
+import os
 import sys
+from dataclasses import dataclass
 from enum import StrEnum
-from typing import Self
+from typing import Literal, Self
 
 from dotenv import load_dotenv
-from pydantic import ValidationError, field_validator, model_validator
+from pydantic import Field, ValidationError, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
-load_dotenv(
-    override=True,  # Override existing environment variables
-)
+logger = logging.getLogger(__name__)
+
+
+def _dotenv_enabled() -> bool:
+    # Containers already receive their environment; set MEM0_LOAD_DOTENV=0 to skip the read
+    return os.getenv("MEM0_LOAD_DOTENV", "1") == "1"
+
+
+if _dotenv_enabled() and os.path.exists(".env"):
+    load_dotenv(
+        ".env",
+        override=True,  # Override existing environment variables
+    )
 
 
 class LogLevel(StrEnum):
@@ -21,6 +33,13 @@ class LogLevel(StrEnum):
     TRACE = "trace"
 
 
+_LEVEL_MAP = {level.value: level for level in LogLevel}
+_ALLOWED_BACKENDS = frozenset({"pgvector", "qdrant"})
+# Placeholder credentials that mark a development/testing configuration
+_DEV_NEO4J_PASSWORDS = frozenset({"password", "mem0graph"})
+_DEV_OPENAI_API_KEYS = frozenset({"your_openai_api_key", "sk-proj-"})
+
+
 class Config(BaseSettings):
     # General configuration
     backend: str = "pgvector"  # Options: "pgvector", "qdrant"
@@ -47,6 +66,15 @@ class Config(BaseSettings):
     fastapi_host: str = "localhost"  # e.g., "localhost" or "0.0.0"
     fastapi_port: int = 8000  # Default
     memory_log_level: LogLevel = LogLevel.INFO  # Default log level for FastAPI
+    # Worker threads available to run_in_threadpool
+    anyio_thread_tokens: int = Field(default=200, ge=1)
+    # Seconds startup waits for backend warmup before serving anyway
+    warmup_timeout: float = Field(default=15.0, gt=0)
+    dev_mode: bool = False  # Reload on source changes when started via src.app
+    workers: int = Field(default=1, ge=1)  # Uvicorn processes when started via src.app
+    server_impl: Literal["uvicorn", "hypercorn"] = "uvicorn"  # hypercorn adds HTTP/2
+    tls_certfile: str | None = None  # Enables TLS (and h2 for browsers) on hypercorn
+    tls_keyfile: str | None = None
 
     # OpenAI configuration
     openai_api_key: str = "your_openai_api_key"
@@ -59,15 +87,13 @@ class Config(BaseSettings):
         if isinstance(v, LogLevel):
             return v
         if isinstance(v, str):
-            # Try to find the enum by value (case-insensitive)
-            v_lower = v.lower()
-            for level in LogLevel:
-                if level.value.lower() == v_lower:
-                    return level
+            # Look up the enum by value (case-insensitive)
+            level = _LEVEL_MAP.get(v.lower())
+            if level is not None:
+                return level
             # If not found, raise an error with helpful message
-            valid_levels = [level.value for level in LogLevel]
             raise ValueError(
-                f"memory_log_level must be one of {valid_levels}, got '{v}'"
+                f"memory_log_level must be one of {list(_LEVEL_MAP)}, got '{v}'"
             )
         raise ValueError(
             f"memory_log_level must be a string or LogLevel enum, got {type(v)}"
@@ -76,24 +102,35 @@ class Config(BaseSettings):
     @field_validator("backend")
     @classmethod
     def validate_backend(cls, v: str) -> str:
-        allowed_backends = {"pgvector", "qdrant"}
-        if v not in allowed_backends:
-            raise ValueError(f"backend must be one of {allowed_backends}, got '{v}'")
+        if v not in _ALLOWED_BACKENDS:
+            raise ValueError(
+                f"backend must be one of {sorted(_ALLOWED_BACKENDS)}, got '{v}'"
+            )
         return v
 
+    @model_validator(mode="after")
+    def validate_server_impl(self) -> Self:
+        # The reload and multi-worker paths only run uvicorn
+        if self.server_impl == "hypercorn" and (self.dev_mode or self.workers > 1):
+            raise ValueError(
+                "server_impl 'hypercorn' runs a single process; "
+                "unset dev_mode and workers to use it"
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_backend_dependencies(self) -> Self:
         # In production, we should validate all required fields
         # Skip validation only in development/testing scenarios
-        is_development = self.neo4j_password in [
-            "password",
-            "mem0graph",
-        ] and self.openai_api_key in ["your_openai_api_key", "sk-proj-"]
+        is_development = (
+            self.neo4j_password in _DEV_NEO4J_PASSWORDS
+            and self.openai_api_key in _DEV_OPENAI_API_KEYS
+        )
 
         if is_development:
-            # Allow development defaults but warn
-            print(
-                "Warning: Using development defaults. Set secure values for production."
+            # Allow development defaults but note it
+            logger.debug(
+                "Using development defaults. Set secure values for production."
             )
             return self
 
@@ -129,13 +166,56 @@ class Config(BaseSettings):
     }
 
 
-@functools.lru_cache(maxsize=1)
-def get_config() -> Config:
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Read-only copy of a validated Config with plain slot attribute access."""
+
+    backend: str
+    history_db_path: str
+    qdrant_host: str
+    qdrant_port: int
+    neo4j_ip: str
+    neo4j_username: str
+    neo4j_password: str
+    postgres_host: str
+    postgres_port: int
+    postgres_user: str
+    postgres_password: str
+    postgres_database: str
+    postgres_collection_name: str
+    fastapi_host: str
+    fastapi_port: int
+    memory_log_level: LogLevel
+    anyio_thread_tokens: int
+    warmup_timeout: float
+    dev_mode: bool
+    workers: int
+    server_impl: Literal["uvicorn", "hypercorn"]
+    tls_certfile: str | None
+    tls_keyfile: str | None
+    openai_api_key: str
+    openai_model: str
+    openai_embedding_model: str
+
+
+def _load_config() -> ConfigSnapshot:
     try:
-        return Config()
+        # Config also reads .env through model_config, so the flag has to reach it too
+        env_file = ".env" if _dotenv_enabled() else None
+        return ConfigSnapshot(**Config(_env_file=env_file).model_dump())
     except ValidationError as e:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Unexpected error while loading configuration: {e}", file=sys.stderr)
         sys.exit(1)
+
+
+_config: ConfigSnapshot | None = None
+
+
+def get_config() -> ConfigSnapshot:
+    global _config
+    if _config is None:
+        _config = _load_config()
+    return _config
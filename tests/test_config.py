@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 from pydantic import ValidationError
 
-from src.config.config import Config
+from src.config.config import Config, ConfigSnapshot, LogLevel, _load_config
 
 
 class TestConfigValidation:
@@ -38,6 +38,31 @@ class TestConfigValidation:
         config_qdrant = Config(backend="qdrant")
         assert config_qdrant.backend == "qdrant"
 
+    def test_memory_log_level_validation(self):
+        """Test that log levels are matched case-insensitively."""
+        assert Config(memory_log_level="WARNING").memory_log_level is LogLevel.WARNING
+
+        with pytest.raises(ValidationError) as exc_info:
+            Config(memory_log_level="verbose")
+
+        assert "memory_log_level must be one of" in str(exc_info.value)
+
+    @pytest.mark.parametrize("field", ["anyio_thread_tokens", "workers"])
+    def test_positive_count_validation(self, field):
+        """Test that thread and worker counts must be at least 1."""
+        with pytest.raises(ValidationError) as exc_info:
+            Config(**{field: 0})
+
+        assert field in str(exc_info.value)
+
+    @pytest.mark.parametrize("override", [{"dev_mode": True}, {"workers": 2}])
+    def test_hypercorn_rejects_uvicorn_only_modes(self, override):
+        """Test that hypercorn cannot be combined with reload or workers."""
+        with pytest.raises(ValidationError) as exc_info:
+            Config(server_impl="hypercorn", **override)
+
+        assert "server_impl 'hypercorn'" in str(exc_info.value)
+
     @patch.dict(
         os.environ,
         {
@@ -61,3 +86,29 @@ class TestConfigValidation:
         assert isinstance(config.qdrant_port, int)
         assert isinstance(config.neo4j_username, str)
         assert isinstance(config.openai_model, str)
+        assert isinstance(config.anyio_thread_tokens, int)
+
+    def test_snapshot_matches_config_fields(self):
+        """Test that the snapshot exposes every Config field, read-only."""
+        snapshot = ConfigSnapshot(**Config().model_dump())
+        assert set(ConfigSnapshot.__slots__) == set(Config.model_fields)
+
+        with pytest.raises(AttributeError):
+            snapshot.backend = "qdrant"
+
+    def test_dotenv_flag_skips_env_file(self, tmp_path, monkeypatch):
+        """Test that MEM0_LOAD_DOTENV=0 keeps .env values out of the config."""
+        (tmp_path / ".env").write_text("BACKEND=qdrant\nWORKERS=7\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BACKEND", raising=False)
+        monkeypatch.delenv("WORKERS", raising=False)
+
+        monkeypatch.setenv("MEM0_LOAD_DOTENV", "1")
+        config = _load_config()
+        assert config.backend == "qdrant"
+        assert config.workers == 7
+
+        monkeypatch.setenv("MEM0_LOAD_DOTENV", "0")
+        config = _load_config()
+        assert config.backend == "pgvector"
+        assert config.workers == 1
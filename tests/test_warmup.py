@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Pytest test suite for the startup warmup guard.
+"""
+
+import asyncio
+import time
+
+from src.app.memory.warmup import run_warmup
+
+
+class TestRunWarmup:
+    """Test suite for run_warmup."""
+
+    def test_completed_warmup(self):
+        """Test that a warmup finishing in time is reported as completed."""
+        calls = []
+
+        async def warmup():
+            calls.append("warmup")
+
+        assert asyncio.run(run_warmup(warmup, timeout=1)) is True
+        assert calls == ["warmup"]
+
+    def test_hanging_warmup_times_out(self, caplog):
+        """Test that a hanging warmup is abandoned after the timeout."""
+
+        async def warmup():
+            await asyncio.Event().wait()
+
+        started = time.monotonic()
+        assert asyncio.run(run_warmup(warmup, timeout=0.05)) is False
+        assert time.monotonic() - started < 1
+        assert "timed out after 0.05s" in caplog.text
+
+    def test_failing_warmup_is_logged(self, caplog):
+        """Test that warmup errors are logged instead of raised."""
+
+        async def warmup():
+            raise ConnectionError("neo4j unavailable")
+
+        assert asyncio.run(run_warmup(warmup, timeout=1)) is False
+        assert "neo4j unavailable" in caplog.text